@@ -1,12 +1,15 @@
 """UI Data Models."""
 
 from typing import Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BlueprintComponent(BaseModel):
     """UI component specification."""
 
+    # Immutable: cached specs are shared by reference across requests
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(..., description="Component type")
     id: str | None = Field(default=None, description="Unique identifier")
     props: dict[str, Any] = Field(default_factory=dict)
@@ -17,6 +20,8 @@ class BlueprintComponent(BaseModel):
 class Blueprint(BaseModel):
     """Complete UI specification."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(default="app")
     title: str
     layout: str = Field(default="vertical")
@@ -28,6 +33,8 @@ class Blueprint(BaseModel):
 
     # Store the complete blueprint JSON (with app/services/ui structure) for sending to backend
     _raw_blueprint_json: str | None = None
+    # Streamed JSON chunks, memoized on the first cache hit (data was validated on insert)
+    _stream_chunks: tuple[str, ...] | None = None
 
 
 BlueprintComponent.model_rebuild()
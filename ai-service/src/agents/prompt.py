@@ -722,12 +722,14 @@ def get_ui_generation_prompt(tools_description: str, context: str = "") -> str:
 
     Args:
         tools_description: Description of available tools
-        context: Additional context (optional)
+        context: Additional context (optional), appended after the fixed instructions
 
     Returns:
         Complete system prompt for Blueprint generation
     """
-    return f"""You are an expert AI that generates Blueprint (.bp) files - a JSON-based DSL for building FULLY FUNCTIONAL applications.
+    # Keep everything before {context} request-independent (no timestamps, ids or per-request
+    # text): providers reuse cached prompt prefixes only up to the first differing token.
+    prompt = f"""You are an expert AI that generates Blueprint (.bp) files - a JSON-based DSL for building FULLY FUNCTIONAL applications.
 
 CRITICAL RULES FOR VALID JSON OUTPUT:
 1. Output ONLY raw JSON - start with {{ and end with }}
@@ -760,8 +762,6 @@ Available Backend Services and Tools:
 
 {BLUEPRINT_EXAMPLES}
 
-{context}
-
 === YOUR TASK ===
 
 Generate a complete, FULLY FUNCTIONAL Blueprint (.bp) file for the user's request.
@@ -817,6 +817,8 @@ OUTPUT FORMAT - EXPLICIT COMPONENTS (valid JSON only, no markdown):
 
 Remember: Output ONLY the JSON object. Start immediately with {{ character."""
 
+    return f"{prompt}\n\n{context}" if context else prompt
+
 
 def get_simple_system_prompt() -> str:
     """Get a simpler system prompt for rule-based generation fallback."""
@@ -1,10 +1,13 @@
 """Prompt Cache - lightweight wrapper around generic LRU cache."""
 
-from functools import lru_cache
+import logging
+
+import xxhash
 
 from core import LRUCache, get_logger
 
 logger = get_logger(__name__)
+_stdlib_logger = logging.getLogger(__name__)
 
 
 class PromptCache:
@@ -14,6 +17,8 @@ class PromptCache:
     Wrapper around core.LRUCache optimized for prompt caching.
     """
 
+    __slots__ = ("_cache",)
+
     def __init__(self, max_size: int = 50) -> None:
         """
         Initialize prompt cache.
@@ -22,7 +27,10 @@ class PromptCache:
             max_size: Maximum number of cached prompts
         """
         self._cache: LRUCache[str] = LRUCache(
-            max_size=max_size, ttl_seconds=None  # Prompts don't expire
+            max_size=max_size,
+            ttl_seconds=None,  # Prompts don't expire
+            # Prompts run to several KB: XXH3 int digests skip hex encoding
+            hash_fn=xxhash.xxh3_64_intdigest,
         )
         logger.info("cache_init", max_size=max_size)
 
@@ -38,10 +46,12 @@ class PromptCache:
         """
         result = self._cache.get(prompt)
 
-        if result:
-            logger.debug("cache_hit", hit_rate=f"{self.hit_rate:.1%}")
-        else:
-            logger.debug("cache_miss")
+        # Only pay for hit-rate computation when debug output is actually emitted
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            if result is not None:
+                logger.debug("cache_hit", hit_rate=self.hit_rate)
+            else:
+                logger.debug("cache_miss")
 
         return result
 
@@ -53,7 +63,8 @@ class PromptCache:
             prompt: Prompt text
         """
         self._cache.set(prompt, prompt)
-        logger.debug("cached", size=len(self._cache))
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("cached", size=len(self._cache))
 
     @property
     def hit_rate(self) -> float:
@@ -66,12 +77,36 @@ class PromptCache:
         return self._cache.stats.to_dict()
 
 
-@lru_cache(maxsize=10)
+_TEMPLATES: dict[str, str] = {}
+
+
+def _build_templates() -> None:
+    """Populate the system prompt template table (runs once, on first lookup)."""
+    from agents.prompt import BLUEPRINT_DOCUMENTATION, get_ui_generation_prompt
+
+    logger.debug("build_templates")
+
+    _TEMPLATES.update(
+        {
+            # Base UI generation prompt without tools/context
+            "ui_generation": get_ui_generation_prompt("", ""),
+            "chat": """You are a helpful AI assistant.
+Provide clear, accurate, and concise responses to user questions.
+Be professional, friendly, and informative.""",
+            "code_generation": """You are an expert code generation assistant.
+Generate clean, efficient, and well-documented code based on user requirements.
+Follow best practices and modern conventions for the specified language.""",
+            "blueprint_generation": BLUEPRINT_DOCUMENTATION,
+        }
+    )
+
+
 def get_system_prompt_template(prompt_type: str = "ui_generation") -> str:
     """
     Get cached system prompt template.
 
-    Uses functools.lru_cache for compile-time templates.
+    Templates are static, so they live in a plain dict built on first use;
+    lookups are a single dict access with no LRU bookkeeping.
 
     Args:
         prompt_type: Type of prompt (ui_generation, chat, etc.)
@@ -79,32 +114,14 @@ def get_system_prompt_template(prompt_type: str = "ui_generation") -> str:
     Returns:
         System prompt template string
     """
-    logger.debug("build_template", type=prompt_type)
-
-    if prompt_type == "ui_generation":
-        from agents.prompt import get_ui_generation_prompt
-
-        # Return base UI generation prompt without tools/context
-        return get_ui_generation_prompt("", "")
-
-    elif prompt_type == "chat":
-        return """You are a helpful AI assistant.
-Provide clear, accurate, and concise responses to user questions.
-Be professional, friendly, and informative."""
-
-    elif prompt_type == "code_generation":
-        return """You are an expert code generation assistant.
-Generate clean, efficient, and well-documented code based on user requirements.
-Follow best practices and modern conventions for the specified language."""
-
-    elif prompt_type == "blueprint_generation":
-        from agents.prompt import BLUEPRINT_DOCUMENTATION
-
-        return BLUEPRINT_DOCUMENTATION
+    if not _TEMPLATES:
+        _build_templates()
 
-    else:
+    template = _TEMPLATES.get(prompt_type)
+    if template is None:
         logger.warn("unknown_prompt_type", type=prompt_type)
         return ""
+    return template
 
 
 __all__ = ["PromptCache", "get_system_prompt_template"]
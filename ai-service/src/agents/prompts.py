@@ -46,14 +46,10 @@ class PromptBuilder:
         Returns:
             Complete prompt
         """
-        parts = [system]
+        tools_sec = f"=== AVAILABLE TOOLS ===\n{tools}" if tools else ""
+        ctx_sec = f"=== CONTEXT ===\n{context}" if context else ""
+        req_sec = f"=== REQUEST ===\n{request}"
 
-        if tools:
-            parts.append(f"\n=== AVAILABLE TOOLS ===\n{tools}")
-
-        if context:
-            parts.append(f"\n=== CONTEXT ===\n{context}")
-
-        parts.append(f"\n=== REQUEST ===\n{request}")
-
-        return "\n".join(parts)
+        # Empty optional sections are dropped; system is kept even when empty so the
+        # request still follows a blank separator
+        return "\n\n".join((system, *filter(None, (tools_sec, ctx_sec)), req_sec))
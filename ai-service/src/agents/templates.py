@@ -3,129 +3,101 @@ App Templates
 Pre-built templates for common app patterns
 """
 
-from pydantic import BaseModel
+from dataclasses import dataclass
+from functools import cache
+from importlib import resources
+from types import MappingProxyType
 
 
-class Template(BaseModel):
+@cache
+def _load_pattern(filename: str) -> str:
+    """Read a template pattern blob from templates_data on first use"""
+    return (resources.files(__package__) / "templates_data" / filename).read_text(encoding="utf-8")
+
+
+@dataclass(frozen=True, slots=True)
+class Template:
     """App template definition"""
 
     id: str
     name: str
     description: str
-    pattern: str
-    components: list[str]
-    service_requirements: list[str]
+    pattern_file: str
+    components: tuple[str, ...]
+    service_requirements: tuple[str, ...]
 
+    @property
+    def pattern(self) -> str:
+        """Layout pattern text, loaded lazily from the template's data file"""
+        return _load_pattern(self.pattern_file)
 
-class TemplateLibrary:
-    """Library of app templates"""
 
-    TEMPLATES = {
+_TEMPLATES = MappingProxyType(
+    {
         "crud": Template(
             id="crud",
             name="CRUD Application",
             description="Create, Read, Update, Delete pattern",
-            pattern="""
-CRUD Pattern:
-1. List View: Display all items
-2. Detail View: View/edit single item
-3. Create: Form to add new item
-4. Update: Edit existing item
-5. Delete: Remove item
-
-Layout:
-- Header with title
-- Create button/form
-- List of items
-- Item actions (edit, delete)
-""",
-            components=["list", "form", "button", "input"],
-            service_requirements=["storage"],
+            pattern_file="crud.txt",
+            components=("list", "form", "button", "input"),
+            service_requirements=("storage",),
         ),
         "form": Template(
             id="form",
             name="Form Application",
             description="Multi-step form with validation",
-            pattern="""
-Form Pattern:
-1. Input fields with validation
-2. Submit button
-3. Success/error feedback
-4. Data persistence
-
-Layout:
-- Form container
-- Input fields
-- Submit button
-- Status message
-""",
-            components=["form", "input", "button", "text"],
-            service_requirements=["storage"],
+            pattern_file="form.txt",
+            components=("form", "input", "button", "text"),
+            service_requirements=("storage",),
         ),
         "dashboard": Template(
             id="dashboard",
             name="Dashboard",
             description="Data visualization and metrics",
-            pattern="""
-Dashboard Pattern:
-1. Grid layout for cards/widgets
-2. Key metrics display
-3. Data visualization
-4. Refresh capability
-
-Layout:
-- Grid container
-- Metric cards
-- Charts/graphs
-- Refresh button
-""",
-            components=["grid", "card", "chart", "button"],
-            service_requirements=["storage"],
+            pattern_file="dashboard.txt",
+            components=("grid", "card", "chart", "button"),
+            service_requirements=("storage",),
         ),
         "chat": Template(
             id="chat",
             name="Chat Interface",
             description="Conversational interface",
-            pattern="""
-Chat Pattern:
-1. Message list/history
-2. Input field for new message
-3. Send button
-4. Real-time updates
-
-Layout:
-- Message container (scrollable)
-- Message bubbles
-- Input + send button
-- Typing indicator
-""",
-            components=["list", "input", "button", "text"],
-            service_requirements=["storage", "ai"],
+            pattern_file="chat.txt",
+            components=("list", "input", "button", "text"),
+            service_requirements=("storage", "ai"),
         ),
     }
+)
+_TEMPLATE_LIST = tuple(_TEMPLATES.values())
+
+# Searchable fields are casefolded and joined once at import; the NUL separator
+# keeps a term from matching across field boundaries.
+_SEARCH_INDEX = tuple(
+    (
+        template,
+        "\0".join((template.name, template.description, *template.service_requirements)).casefold(),
+    )
+    for template in _TEMPLATE_LIST
+)
+
+
+class TemplateLibrary:
+    """Library of app templates"""
+
+    TEMPLATES = _TEMPLATES
 
     @classmethod
-    def get(cls, template_id: str) -> Template:
+    def get(cls, template_id: str) -> Template | None:
         """Get template by ID"""
         return cls.TEMPLATES.get(template_id)
 
     @classmethod
-    def list_all(cls) -> list[Template]:
+    def list_all(cls) -> tuple[Template, ...]:
         """List all templates"""
-        return list(cls.TEMPLATES.values())
+        return _TEMPLATE_LIST
 
     @classmethod
     def search(cls, query: str) -> list[Template]:
-        """Search templates by query"""
-        query_lower = query.lower()
-        results = []
-
-        for template in cls.TEMPLATES.values():
-            if (
-                query_lower in template.name.lower()
-                or query_lower in template.description.lower()
-                or any(query_lower in req for req in template.service_requirements)
-            ):
-                results.append(template)
-
-        return results
+        """Search templates by query (every whitespace-separated term must match)"""
+        terms = query.casefold().split() or [query]
+        return [template for template, blob in _SEARCH_INDEX if all(term in blob for term in terms)]
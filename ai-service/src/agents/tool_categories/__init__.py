@@ -2,16 +2,69 @@
 Tool Categories
 Modular organization of tool definitions by category.
 
+Definitions live in builtin_tools.json as {group: [tool, ...]} and are parsed once
+with orjson at import, instead of executing one Python module per category.
+
 Note: Browser and simple math operations moved to Go backend.
 This package contains Python-specific tools and symbolic math only.
 """
 
-from .ui_tools import register_ui_tools
-from .app_tools import register_app_tools
-from .system_tools import register_system_tools
-from .math import register_math_tools  # Symbolic operations only
+from __future__ import annotations
+
+from collections.abc import Mapping
+from importlib import resources
+from itertools import chain
+from types import MappingProxyType
+from typing import Any
+
+import orjson
+
+# agents.tools imports this package lazily, so a module-level import is cycle-free
+from ..tools import ToolDefinition, ToolRegistry
+
+_DATA_FILE = "builtin_tools.json"
+
+# Group (ui, app, system, math) -> tool definitions, in registration order
+TOOL_GROUPS: Mapping[str, tuple[dict[str, Any], ...]] = MappingProxyType(
+    {
+        group: tuple(definitions)
+        for group, definitions in orjson.loads(
+            resources.files(__package__).joinpath(_DATA_FILE).read_bytes()
+        ).items()
+    }
+)
+
+# Every built-in tool definition, aggregated once at import in registration order
+TOOL_DEFS: tuple[dict[str, Any], ...] = tuple(chain.from_iterable(TOOL_GROUPS.values()))
+
+
+def _register_group(registry: ToolRegistry, group: str) -> None:
+    registry.register_bulk(ToolDefinition(**definition) for definition in TOOL_GROUPS[group])
+
+
+def register_ui_tools(registry: ToolRegistry) -> None:
+    """Register generic UI tools that work across all app types."""
+    _register_group(registry, "ui")
+
+
+def register_app_tools(registry: ToolRegistry) -> None:
+    """Register app lifecycle management tools."""
+    _register_group(registry, "app")
+
+
+def register_system_tools(registry: ToolRegistry) -> None:
+    """Register system-level tools."""
+    _register_group(registry, "system")
+
+
+def register_math_tools(registry: ToolRegistry) -> None:
+    """Register symbolic math tool categories (algebra, calculus)."""
+    _register_group(registry, "math")
+
 
 __all__ = [
+    "TOOL_DEFS",
+    "TOOL_GROUPS",
     "register_ui_tools",
     "register_app_tools",
     "register_system_tools",
@@ -1,15 +1,14 @@
 """Tool Registry - Modular system with strong typing."""
 
-from typing import Any
-from pydantic import BaseModel, Field
+import itertools
+import sys
+from typing import Any, ClassVar
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from core import get_logger
-from .tool_categories import (
-    register_ui_tools,
-    register_app_tools,
-    register_system_tools,
-    register_math_tools,
-)
 
 logger = get_logger(__name__)
 
@@ -19,16 +18,74 @@ logger = get_logger(__name__)
 # ============================================================================
 
 
-class ToolDefinition(BaseModel):
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Process-wide registry version stamps. 0 is the shared built-in tool set; every
+# registration on any registry draws a fresh stamp, so two registries only share a
+# version while both hold exactly the built-ins.
+_VERSION_STAMPS = itertools.count(1)
+
+# Category order for AI context (generic first, specialized later)
+_CATEGORY_ORDER = (
+    "ui",
+    "app",
+    "browser",
+    "system",
+    "math",
+    "storage",
+    "network",
+    "timer",
+    "clipboard",
+    "notification",
+)
+
+
+def _intern_str(value: Any) -> Any:
+    """Intern exact str values; anything else is returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Distinct parameter schemas (ordered items) -> shared read-only mapping. Unbounded on
+# purpose: there are only a few dozen schemas and eviction would split sharing.
+_PARAM_CACHE: dict[tuple[tuple[str, Any], ...], Mapping[str, Any]] = {}
+
+
+def _intern_params(items: tuple[tuple[str, Any], ...]) -> Mapping[str, Any]:
+    """Return one shared read-only mapping per distinct parameter schema."""
+    if not items:
+        return _EMPTY_PARAMS
+    parameters = _PARAM_CACHE.get(items)  # TypeError for unhashable schema values
+    if parameters is None:
+        parameters = _PARAM_CACHE[items] = MappingProxyType(dict(items))
+    return parameters
+
+
+@dataclass(frozen=True, slots=True)
+class ToolDefinition:
     """Definition of a callable tool."""
 
-    id: str = Field(..., description="Unique tool identifier")
-    name: str = Field(..., description="Human-readable name")
-    description: str = Field(..., description="What the tool does")
-    parameters: dict[str, Any] = Field(default_factory=dict, description="Parameter schema")
-    category: str = Field(
-        default="general", description="Tool category (compute, ui, system, etc.)"
-    )
+    id: str  # Unique tool identifier
+    name: str  # Human-readable name
+    description: str  # What the tool does
+    parameters: Mapping[str, Any] = field(default_factory=dict)  # Parameter schema
+    category: str = "general"  # Tool category (compute, ui, system, etc.)
+    _params_str: str = field(init=False, repr=False, compare=False)  # Rendered for AI context
+
+    def __post_init__(self) -> None:
+        # Interned ids/categories share storage and compare by pointer in index lookups
+        object.__setattr__(self, "id", _intern_str(self.id))
+        object.__setattr__(self, "category", _intern_str(self.category))
+
+        # Tools with the same schema (in the same key order) share one mapping
+        items = tuple((_intern_str(k), _intern_str(v)) for k, v in self.parameters.items())
+        try:
+            parameters = _intern_params(items)
+        except TypeError:  # Unhashable schema values can't be interned
+            parameters = MappingProxyType(dict(items))
+        object.__setattr__(self, "parameters", parameters)
+
+        params = ", ".join(f"{k}: {v}" for k, v in items)
+        object.__setattr__(self, "_params_str", f"({params})" if params else "(no params)")
 
 
 class ToolRegistry:
@@ -37,72 +94,156 @@ class ToolRegistry:
     Uses hybrid approach: generic tools + specialized tools for common apps.
     """
 
+    # Built-ins are built once per process and shallow-copied per instance
+    # (definitions are frozen, so sharing them is safe)
+    _builtin_tools: ClassVar[dict[str, ToolDefinition]] = {}
+    _builtin_sections: ClassVar[dict[str, str]] = {}
+    _builtin_description: ClassVar[str] = ""
+
     def __init__(self) -> None:
         self.tools: dict[str, ToolDefinition] = {}
+        # Secondary index: category -> {tool_id: tool}, kept in sync on register
+        self._by_category: defaultdict[str, dict[str, ToolDefinition]] = defaultdict(dict)
+        self._sorted_categories: list[str] | None = None
+        # Rendered description blocks per category, dropped when a tool in them changes
+        self._desc_sections: dict[str, str] = {}
+        self._desc_cache: str | None = None
+        # Restamped on every registration so dependents (e.g. UI spec cache keys, which a
+        # process-wide cache shares across registries) can tell tool sets apart
+        self.version = 0
         self._initialize_builtin_tools()
 
     def _initialize_builtin_tools(self) -> None:
         """Initialize built-in tools from modular categories."""
-        logger.info("Initializing modular tool system...")
+        if not ToolRegistry._builtin_tools:
+            logger.info("Initializing modular tool system...")
 
-        # Register tools from each category module
-        register_ui_tools(self, ToolDefinition)
-        register_app_tools(self, ToolDefinition)
-        register_system_tools(self, ToolDefinition)
-        register_math_tools(self, ToolDefinition)
+            # Category data modules load on first registry build, not on `import agents`;
+            # they are flattened into one tuple at their import
+            from .tool_categories import TOOL_DEFS as BUILTIN_TOOL_DEFS
 
-        logger.info(
-            f"Registered {len(self.tools)} tools across {len(self.get_categories())} categories"
-        )
+            ToolRegistry._builtin_tools = {
+                definition["id"]: ToolDefinition(**definition) for definition in BUILTIN_TOOL_DEFS
+            }
+
+        self.tools = dict(ToolRegistry._builtin_tools)
+        for tool in self.tools.values():
+            self._by_category[tool.category][tool.id] = tool
+
+        # Pre-render the AI context; it only changes when more tools are registered
+        if not ToolRegistry._builtin_description:
+            ToolRegistry._builtin_description = self._build_description(_CATEGORY_ORDER)
+            ToolRegistry._builtin_sections = dict(self._desc_sections)
+        self._desc_sections = dict(ToolRegistry._builtin_sections)
+        self._desc_cache = ToolRegistry._builtin_description
+
+        logger.info("tools_initialized", tools=len(self.tools), categories=len(self._by_category))
 
     def register_tool(self, tool: ToolDefinition) -> None:
         """Register a new tool."""
+        self._add_tool(tool)
+        self._desc_cache = None
+        logger.debug("tool_registered", id=tool.id, name=tool.name)
+
+    def register_bulk(self, tools: Iterable[ToolDefinition]) -> None:
+        """Register many tools in one pass with a single debug summary."""
+        count = 0
+        for tool in tools:
+            self._add_tool(tool)
+            count += 1
+        self._desc_cache = None
+        logger.debug("tools_registered", count=count)
+
+    def _add_tool(self, tool: ToolDefinition) -> None:
+        """Store a tool and update the category index, dropping any tool it replaces."""
+        previous = self.tools.get(tool.id)
+        self._desc_sections.pop(tool.category, None)
+        if previous is not None and previous.category != tool.category:
+            self._desc_sections.pop(previous.category, None)
+            bucket = self._by_category[previous.category]
+            del bucket[tool.id]
+            if not bucket:
+                del self._by_category[previous.category]
+                self._sorted_categories = None
+        if tool.category not in self._by_category:
+            self._sorted_categories = None
+        self._by_category[tool.category][tool.id] = tool
         self.tools[tool.id] = tool
-        logger.info(f"Registered tool: {tool.id} ({tool.name})")
+        self.version = next(_VERSION_STAMPS)
 
     def get_tool(self, tool_id: str) -> ToolDefinition | None:
         """Get tool by ID."""
         return self.tools.get(tool_id)
 
+    def dispatch(self, tool_id: str) -> ToolDefinition:
+        """
+        Get tool by ID for hot-path routing, raising KeyError if unknown.
+
+        Callers catch KeyError once instead of checking for None on every hit.
+        """
+        return self.tools[tool_id]
+
     def get_categories(self) -> list[str]:
         """Get list of all tool categories."""
-        return sorted({tool.category for tool in self.tools.values()})
+        if self._sorted_categories is None:
+            self._sorted_categories = sorted(self._by_category)
+        return list(self._sorted_categories)
 
     def list_tools(self, category: str | None = None) -> list[ToolDefinition]:
         """List all tools, optionally filtered by category."""
-        tools = list(self.tools.values())
         if category:
-            tools = [t for t in tools if t.category == category]
-        return tools
-
-    def get_tools_description(self) -> str:
-        """Get formatted description of all tools for AI context."""
-        lines = ["=== FRONTEND TOOLS ==="]
-
-        # Define category order (generic first, specialized later)
-        categories = [
-            "ui",
-            "app",
-            "browser",
-            "system",
-            "math",
-            "storage",
-            "network",
-            "timer",
-            "clipboard",
-            "notification",
-        ]
+            bucket = self._by_category.get(category)
+            return list(bucket.values()) if bucket else []
+        return list(self.tools.values())
 
-        for category in categories:
-            category_tools = self.list_tools(category)
-            if category_tools:
-                lines.append(f"\n{category.upper()}:")
-                for tool in category_tools:
-                    params = ", ".join(f"{k}: {v}" for k, v in tool.parameters.items())
-                    params_str = f"({params})" if params else "(no params)"
-                    lines.append(f"  - {tool.id}: {tool.description} {params_str}")
+    def iter_tools(self, category: str | None = None) -> Iterable[ToolDefinition]:
+        """
+        Iterate tools without copying, optionally filtered by category.
+
+        Returns a live view: don't register tools while iterating it.
+        """
+        if category:
+            bucket = self._by_category.get(category)
+            return bucket.values() if bucket else ()
+        return self.tools.values()
+
+    def get_tools_description(self, categories: Iterable[str] | None = None) -> str:
+        """
+        Get formatted description of tools for AI context.
+
+        Args:
+            categories: Only describe these categories, in this order. Defaults to every
+                standard category; that full description is cached until the next register.
+
+        Returns:
+            Tool description text
+        """
+        if categories is not None:
+            return self._build_description(categories)
+        if self._desc_cache is None:
+            self._desc_cache = self._build_description(_CATEGORY_ORDER)
+        return self._desc_cache
+
+    def _build_description(self, categories: Iterable[str]) -> str:
+        """Join the cached blocks of the requested categories under the header."""
+        sections = [
+            self._render_section(category)
+            for category in categories
+            if category in self._by_category
+        ]
+        return "\n".join(["=== FRONTEND TOOLS ===", *sections])
 
-        return "\n".join(lines)
+    def _render_section(self, category: str) -> str:
+        """Render one category block from the category index, caching the result."""
+        section = self._desc_sections.get(category)
+        if section is None:
+            lines = [f"\n{category.upper()}:"]
+            lines.extend(
+                f"  - {tool.id}: {tool.description} {tool._params_str}"
+                for tool in self._by_category[category].values()
+            )
+            section = self._desc_sections[category] = "\n".join(lines)
+        return section
 
 
 # ============================================================================
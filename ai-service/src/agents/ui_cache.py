@@ -1,16 +1,72 @@
-"""UI Specification Cache - lightweight wrapper around generic LRU cache."""
+"""UI Specification Cache - generic LRU cache specialized for Blueprints."""
+
+from functools import lru_cache
 
 from core import LRUCache
 from .models import Blueprint
 
+# Words that don't change which UI is wanted, dropped anywhere so near-duplicate
+# phrasings share an entry ("make me a calculator", "calculator please"): articles
+# and politeness.
+_FILLER_WORDS = frozenset({"a", "an", "the", "me", "please", "some"})
+
+# Request verbs, dropped only as the first remaining word: "make a calculator" asks
+# for a calculator, "calculator that can make graphs" is a different app
+_REQUEST_VERBS = frozenset({"make", "create", "build", "generate"})
+
+# Generic app nouns, dropped only as the last word ("todo app", not "app store browser").
+# Specific app nouns (calculator, todo, ...) are kept: the rule-based generator picks
+# the app type from them.
+_APP_NOUNS = frozenset({"app", "application"})
+
+# Punctuation trimmed from word edges so "calculator," and "calculator!" match
+_EDGE_PUNCTUATION = ".,!?;:"
+
+# Separates a caller's scope (e.g. a tool-set version) from the request in a key; only
+# the request part is normalized, so verbs after the scope still count as leading
+_SCOPE_SEP = "\x1f"
+
+
+# Pure and cheap to key: a miss's get() and the following set() normalize once
+@lru_cache(maxsize=1024)
+def _normalize_request(request: str) -> str:
+    """
+    Canonicalize a request so trivially different phrasings share a cache entry.
+
+    Returns an empty string when only filler is left ("make an app").
+    """
+    # str.split/join collapses whitespace faster than a regex substitution
+    words = [
+        word
+        for word in (word.strip(_EDGE_PUNCTUATION) for word in request.lower().split())
+        if word and word not in _FILLER_WORDS
+    ]
+    if words and words[0] in _REQUEST_VERBS:
+        del words[0]
+    if words and words[-1] in _APP_NOUNS:
+        words.pop()
+    return " ".join(words)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_key(key: str) -> str:
+    """Normalize the request part of a key, keeping any scope before _SCOPE_SEP as is."""
+    scope, sep, request = key.partition(_SCOPE_SEP)
+    if not sep:
+        return _normalize_request(key)
+    return f"{scope}{sep}{_normalize_request(request)}"
 
-class UICache:
+
+class UICache(LRUCache[Blueprint]):
     """
     Type-safe LRU cache for UI specifications.
 
-    Wrapper around core.LRUCache with Blueprint type enforcement.
+    Subclasses core.LRUCache directly (no forwarding frame per call) and
+    normalizes request keys through the key_fn hook.
     """
 
+    __slots__ = ()
+
     def __init__(self, max_size: int = 100, ttl_seconds: int = 3600) -> None:
         """
         Initialize UI cache.
@@ -19,24 +75,18 @@ class UICache:
             max_size: Maximum cached specs
             ttl_seconds: Time-to-live in seconds
         """
-        self._cache: LRUCache[Blueprint] = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        super().__init__(max_size=max_size, ttl_seconds=ttl_seconds, key_fn=_normalize_key)
 
-    def get(self, key: str) -> Blueprint | None:
-        """Get cached UI spec if valid."""
-        return self._cache.get(key)
-
-    def set(self, key: str, spec: Blueprint) -> None:
-        """Cache UI spec."""
-        self._cache.set(key, spec)
-
-    def clear(self) -> None:
-        """Clear cache."""
-        self._cache.clear()
+    def scoped_key(self, scope: str, request: str) -> str | None:
+        """
+        Key for a request within a caller's scope, normalized once by get/set.
 
-    @property
-    def stats(self):
-        """Get cache statistics."""
-        return self._cache.stats
+        Returns None when the request is all filler ("make an app"): such requests
+        must not be cached, or every caller would share their one entry.
+        """
+        if not _normalize_request(request):
+            return None
+        return f"{scope}{_SCOPE_SEP}{request}"
 
 
 __all__ = ["UICache"]
@@ -1,7 +1,9 @@
 """UI Generator Agent - Fast JSON with error handling."""
 
+import json
 from typing import Any
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
 from langchain_core.language_models import BaseLLM
 
 from core import get_logger, extract_json, safe_json_dumps, JSONParseError
@@ -16,6 +18,148 @@ from .models import BlueprintComponent, Blueprint
 logger = get_logger(__name__)
 
 
+def _parse_ui_spec(blueprint_json: str) -> dict[str, Any]:
+    """Parse Blueprint JSON to its ui_spec dict."""
+    ui_spec: dict[str, Any] = parse_blueprint(blueprint_json).get("ui_spec", {})
+    return ui_spec
+
+
+def _split_chunks(text: str, size: int) -> tuple[str, ...]:
+    """Split text into consecutive chunks of at most size characters for streaming."""
+    return tuple(text[i : i + size] for i in range(0, len(text), size))
+
+
+# Fixed rule-based blueprints, streamed verbatim (keyword -> (Blueprint JSON, title)).
+# Checked in order; the first keyword found in the request wins.
+_CALCULATOR_BLUEPRINT = """{
+  "app": {
+    "id": "calculator",
+    "name": "Calculator",
+    "version": "1.0.0",
+    "author": "system",
+    "permissions": ["STANDARD"]
+  },
+  "services": [],
+  "ui": {
+    "title": "Calculator",
+    "layout": "vertical",
+    "components": [
+      {"type": "input", "id": "display", "props": {"value": "0", "readonly": true}},
+      {
+        "type": "grid",
+        "id": "buttons",
+        "props": {"columns": 4, "gap": 8},
+        "children": [
+          {"type": "button", "id": "7", "props": {"text": "7"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "8", "props": {"text": "8"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "9", "props": {"text": "9"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "div", "props": {"text": "÷"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "4", "props": {"text": "4"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "5", "props": {"text": "5"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "6", "props": {"text": "6"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "mul", "props": {"text": "×"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "1", "props": {"text": "1"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "2", "props": {"text": "2"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "3", "props": {"text": "3"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "sub", "props": {"text": "−"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "0", "props": {"text": "0"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "clear", "props": {"text": "C"}, "on_event": {"click": "ui.clear"}},
+          {"type": "button", "id": "equals", "props": {"text": "="}, "on_event": {"click": "ui.compute"}},
+          {"type": "button", "id": "add", "props": {"text": "+"}, "on_event": {"click": "ui.append"}}
+        ]
+      }
+    ]
+  }
+}"""
+
+_COUNTER_BLUEPRINT = """{
+  "app": {
+    "id": "counter",
+    "name": "Counter",
+    "version": "1.0.0",
+    "author": "system",
+    "permissions": ["STANDARD"]
+  },
+  "services": [],
+  "ui": {
+    "title": "Counter",
+    "layout": "vertical",
+    "components": [
+      {"type": "input", "id": "count", "props": {"value": "0", "readonly": true}},
+      {
+        "type": "row",
+        "id": "controls",
+        "props": {"gap": 12},
+        "children": [
+          {"type": "button", "id": "inc", "props": {"text": "+1"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "dec", "props": {"text": "-1"}, "on_event": {"click": "ui.append"}},
+          {"type": "button", "id": "compute", "props": {"text": "="}, "on_event": {"click": "ui.compute"}},
+          {"type": "button", "id": "reset", "props": {"text": "Clear"}, "on_event": {"click": "ui.clear"}}
+        ]
+      }
+    ]
+  }
+}"""
+
+_TODO_BLUEPRINT = """{
+  "app": {
+    "id": "todo",
+    "name": "Todo App",
+    "version": "1.0.0",
+    "author": "system",
+    "permissions": ["STANDARD"]
+  },
+  "services": [],
+            "ui": {
+                "title": "Todo App",
+                "layout": "vertical",
+                "components": [
+                    {"type": "text", "id": "header", "props": {"content": "Todo List", "variant": "h2"}},
+      {
+        "type": "row",
+        "id": "input",
+        "props": {"gap": 8},
+        "children": [
+          {"type": "input", "id": "task-input", "props": {"placeholder": "New task..."}},
+          {"type": "button", "id": "add", "props": {"text": "Add"}, "on_event": {"click": "ui.list.add"}}
+        ]
+      },
+      {
+        "type": "col",
+        "id": "list",
+        "props": {"gap": 8}
+      }
+    ]
+  }
+}"""
+
+_RULE_BLUEPRINTS: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "calculator": (_CALCULATOR_BLUEPRINT, "Calculator"),
+        "counter": (_COUNTER_BLUEPRINT, "Counter"),
+        "todo": (_TODO_BLUEPRINT, "Todo App"),
+    }
+)
+
+# Fixed blueprints parsed once at import (keyword -> ui_spec dict). The dicts are shared:
+# validate them into models, never mutate them. Placeholders embed the request text, so
+# they are parsed per request and not cached.
+_RULE_UI_SPECS: Mapping[str, dict[str, Any]] = MappingProxyType(
+    {
+        keyword: _parse_ui_spec(blueprint_json)
+        for keyword, (blueprint_json, _) in _RULE_BLUEPRINTS.items()
+    }
+)
+
+# Fixed blueprints sliced into stream chunks once at import (keyword -> chunks)
+_RULE_CHUNKS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        keyword: _split_chunks(blueprint_json, 50)
+        for keyword, (blueprint_json, _) in _RULE_BLUEPRINTS.items()
+    }
+)
+
+
 class Templates:
     """Component templates."""
 
@@ -72,13 +216,23 @@ class UIGenerator:
         llm: BaseLLM | None = None,
         backend_services: list[Any] | None = None,
         enable_cache: bool = True,
+        cache: UICache | None = None,
     ) -> None:
         self.tool_registry = tool_registry
         self.templates = Templates()
         self.llm = llm
         self.use_llm = llm is not None
         self.backend_services = backend_services or []
-        self.cache = UICache(max_size=100, ttl_seconds=3600) if enable_cache else None
+        # A shared cache (e.g. the container's process-wide one) pools hits across generators
+        if not enable_cache:
+            self.cache = None
+        else:
+            self.cache = cache if cache is not None else UICache(max_size=100, ttl_seconds=3600)
+
+        # Rendered request-independent prompt prefix and the tools description it was built
+        # from (the registry hands out the same str object until a tool is registered)
+        self._prompt_prefix: str | None = None
+        self._prefix_tools_desc: str | None = None
 
         logger.info("initialized", mode="llm" if self.use_llm else "rule-based")
 
@@ -89,7 +243,15 @@ class UIGenerator:
 
     def generate_ui(self, request: str) -> Blueprint:
         """Generate Blueprint (non-streaming)."""
-        for item in self.generate_ui_stream(request):
+        # Cache hits return directly, without rendering stream chunks nobody reads
+        cache_key = self._cache_key(request)
+        if self.cache is not None and cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.info("cache_hit")
+                return cached
+
+        for item in self._generate_uncached(request):
             if isinstance(item, Blueprint):
                 return item
         raise ValueError("No Blueprint generated")
@@ -97,16 +259,24 @@ class UIGenerator:
     def generate_ui_stream(self, request: str) -> Iterator[str | dict | Blueprint]:
         """Stream UI generation."""
         # Check cache
-        if self.cache:
-            cached = self.cache.get(request)
+        cache_key = self._cache_key(request)
+        if self.cache is not None and cache_key is not None:
+            cached = self.cache.get(cache_key)
             if cached:
                 logger.info("cache_hit")
-                json_str = safe_json_dumps(cached.model_dump(), indent=2)
-                for i in range(0, len(json_str), 100):
-                    yield json_str[i : i + 100]
+                # Rendered and sliced once per cached spec; later hits replay the chunks
+                chunks = cached._stream_chunks
+                if chunks is None:
+                    json_str = safe_json_dumps(cached.model_dump(), indent=2)
+                    chunks = cached._stream_chunks = _split_chunks(json_str, 100)
+                yield from chunks
                 yield cached
                 return
 
+        yield from self._generate_uncached(request)
+
+    def _generate_uncached(self, request: str) -> Iterator[str | dict | Blueprint]:
+        """Stream a fresh generation: LLM first, rule-based fallback."""
         # Try LLM generation
         if self.use_llm:
             try:
@@ -119,52 +289,82 @@ class UIGenerator:
         # Fallback to rule-based
         yield from self._generate_rules(request)
 
+    def _cache_key(self, request: str) -> str | None:
+        """
+        Cache key for a request, scoped to the registry's current tool set.
+
+        None when caching is off or the request is all filler ("make an app"): such
+        requests would otherwise share one entry across every caller.
+        """
+        if self.cache is None:
+            return None
+        # Specs generated before a tool was registered aren't served afterwards
+        return self.cache.scoped_key(f"tools{self.tool_registry.version}", request)
+
+    def invalidate_tool_cache(self) -> None:
+        """Drop the rendered prompt prefix, e.g. after replacing backend_services."""
+        self._prompt_prefix = None
+
+    def _get_prompt_prefix(self) -> str:
+        """Get the request-independent system prompt, rebuilt only when the tools change."""
+        tools_desc = self.tool_registry.get_tools_description()
+        if self._prompt_prefix is None or tools_desc is not self._prefix_tools_desc:
+            full_desc = tools_desc
+            if self.backend_services:
+                full_desc += self._format_backend_services()
+            self._prompt_prefix = get_ui_generation_prompt(full_desc, "")
+            self._prefix_tools_desc = tools_desc
+        return self._prompt_prefix
+
     def _generate_llm(self, request: str) -> Iterator[str | Blueprint]:
         """Generate with LLM - stream JSON in small chunks for incremental component rendering."""
         if not self.llm:
             raise ValueError("LLM not configured")
 
-        tools_desc = self.tool_registry.get_tools_description()
-        if self.backend_services:
-            tools_desc += self._format_backend_services()
-
-        prompt = get_ui_generation_prompt(tools_desc, "")
-        prompt += f"\n\n=== REQUEST ===\n{request}\n\nGenerate Blueprint:"
+        # Stable prefix first, request last: byte-identical prefixes let the provider
+        # reuse its prompt cache across requests
+        prompt = f"{self._get_prompt_prefix()}\n\n=== REQUEST ===\n{request}\n\nGenerate Blueprint:"
 
         logger.info("llm_generate")
 
         # Stream LLM tokens in real-time while accumulating
-        content = ""
+        parts: list[str] = []  # Joined once at the end instead of re-copied per token
         started_json = False
-        buffer = ""  # Buffer for chunking
+        buffer = ""  # Unsent tail, always shorter than CHUNK_SIZE between tokens
         CHUNK_SIZE = 50  # Send ~50 chars at a time for smooth component rendering
 
         for token in self.llm.stream(prompt):
-            token_str = token.content if hasattr(token, "content") else str(token)
-            content += token_str
-
-            # Start streaming once we see the opening brace
-            if not started_json and "{" in content:
-                started_json = True
-                # Extract clean JSON (skip any markdown before the {)
-                json_start = content.find("{")
-                clean_content = content[json_start:]
-                buffer = clean_content
-            elif started_json:
-                # Add to buffer
+            # GeminiModel yields plain str; only LangChain message chunks need unwrapping
+            if type(token) is str:
+                token_str = token
+            else:
+                token_str = token.content if hasattr(token, "content") else str(token)
+            parts.append(token_str)
+
+            if started_json:
                 buffer += token_str
+            else:
+                # Earlier tokens had no brace, so only the new token needs scanning;
+                # skip any markdown before the {
+                json_start = token_str.find("{")
+                if json_start == -1:
+                    continue
+                started_json = True
+                buffer = token_str[json_start:]
 
-            # Yield buffer in chunks for smooth incremental updates
-            while len(buffer) >= CHUNK_SIZE:
-                chunk = buffer[:CHUNK_SIZE]
-                buffer = buffer[CHUNK_SIZE:]
-                yield chunk
+            # Yield whole chunks for smooth incremental updates, keeping the remainder
+            if len(buffer) >= CHUNK_SIZE:
+                split = len(buffer) - len(buffer) % CHUNK_SIZE
+                for i in range(0, split, CHUNK_SIZE):
+                    yield buffer[i : i + CHUNK_SIZE]
+                buffer = buffer[split:]
 
         # Yield any remaining buffer
-        if buffer and started_json:
+        if buffer:
             yield buffer
 
         # Clean up complete response for parsing
+        content = "".join(parts)
         logger.info("llm_complete", content_length=len(content))
 
         json_content = content.strip()
@@ -185,7 +385,7 @@ class UIGenerator:
         if "\n---" in json_content:
             json_content = json_content.split("\n---")[0].strip()
 
-        logger.info("llm_cleaned_json", json_length=len(json_content), preview=json_content[:200])
+        logger.debug("llm_cleaned_json", json_length=len(json_content), preview=json_content[:200])
 
         # Parse complete Blueprint JSON to Blueprint
         logger.info("llm_parsing")
@@ -205,8 +405,9 @@ class UIGenerator:
             logger.error("llm_parse_failed", error=str(e), content_preview=content[:500])
             raise
 
-        if self.cache:
-            self.cache.set(request, ui_spec)
+        cache_key = self._cache_key(request)
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, ui_spec)
 
         yield ui_spec
 
@@ -214,33 +415,31 @@ class UIGenerator:
         """Rule-based generation - outputs Blueprint JSON format."""
         request_lower = request.lower()
 
-        # Use pattern matching for cleaner app type detection
-        match request_lower:
-            case s if "calculator" in s:
-                blueprint_json = self._build_calculator_blueprint()
-                title = "Calculator"
-            case s if "counter" in s:
-                blueprint_json = self._build_counter_blueprint()
-                title = "Counter"
-            case s if "todo" in s:
-                blueprint_json = self._build_todo_blueprint()
-                title = "Todo App"
-            case _:
-                blueprint_json = self._build_placeholder_blueprint(request)
-                title = "Generated App"
+        # Fixed blueprints are module constants; anything else gets a placeholder
+        keyword = next((k for k in _RULE_BLUEPRINTS if k in request_lower), None)
+        if keyword is not None:
+            blueprint_json, title = _RULE_BLUEPRINTS[keyword]
+            ui_spec_dict: dict[str, Any] | None = _RULE_UI_SPECS[keyword]
+            chunks = _RULE_CHUNKS[keyword]
+        else:
+            blueprint_json = self._build_placeholder_blueprint(request)
+            title = "Generated App"
+            ui_spec_dict = None
+            chunks = _split_chunks(blueprint_json, 50)
 
         # Stream Blueprint JSON
-        for i in range(0, len(blueprint_json), 50):
-            yield blueprint_json[i : i + 50]
+        yield from chunks
 
         # Parse to Blueprint for caching
         try:
-            package_dict = parse_blueprint(blueprint_json)
-            ui_spec = Blueprint.model_validate(package_dict.get("ui_spec", {}))
+            if ui_spec_dict is None:
+                ui_spec_dict = _parse_ui_spec(blueprint_json)
+            ui_spec = Blueprint.model_validate(ui_spec_dict)
             # Store the raw complete blueprint JSON for sending to backend
             ui_spec._raw_blueprint_json = blueprint_json
-            if self.cache:
-                self.cache.set(request, ui_spec)
+            cache_key = self._cache_key(request)
+            if self.cache is not None and cache_key is not None:
+                self.cache.set(cache_key, ui_spec)
             yield ui_spec
         except Exception as e:
             logger.warning("rule_based_parse_failed", error=str(e))
@@ -248,118 +447,8 @@ class UIGenerator:
             ui_spec = Blueprint(title=title, components=[])
             yield ui_spec
 
-    def _build_calculator_blueprint(self) -> str:
-        """Generate Calculator Blueprint JSON - explicit format for streaming."""
-        return """{
-  "app": {
-    "id": "calculator",
-    "name": "Calculator",
-    "version": "1.0.0",
-    "author": "system",
-    "permissions": ["STANDARD"]
-  },
-  "services": [],
-  "ui": {
-    "title": "Calculator",
-    "layout": "vertical",
-    "components": [
-      {"type": "input", "id": "display", "props": {"value": "0", "readonly": true}},
-      {
-        "type": "grid",
-        "id": "buttons",
-        "props": {"columns": 4, "gap": 8},
-        "children": [
-          {"type": "button", "id": "7", "props": {"text": "7"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "8", "props": {"text": "8"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "9", "props": {"text": "9"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "div", "props": {"text": "÷"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "4", "props": {"text": "4"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "5", "props": {"text": "5"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "6", "props": {"text": "6"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "mul", "props": {"text": "×"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "1", "props": {"text": "1"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "2", "props": {"text": "2"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "3", "props": {"text": "3"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "sub", "props": {"text": "−"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "0", "props": {"text": "0"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "clear", "props": {"text": "C"}, "on_event": {"click": "ui.clear"}},
-          {"type": "button", "id": "equals", "props": {"text": "="}, "on_event": {"click": "ui.compute"}},
-          {"type": "button", "id": "add", "props": {"text": "+"}, "on_event": {"click": "ui.append"}}
-        ]
-      }
-    ]
-  }
-}"""
-
-    def _build_counter_blueprint(self) -> str:
-        """Generate Counter Blueprint JSON - explicit format for streaming."""
-        return """{
-  "app": {
-    "id": "counter",
-    "name": "Counter",
-    "version": "1.0.0",
-    "author": "system",
-    "permissions": ["STANDARD"]
-  },
-  "services": [],
-  "ui": {
-    "title": "Counter",
-    "layout": "vertical",
-    "components": [
-      {"type": "input", "id": "count", "props": {"value": "0", "readonly": true}},
-      {
-        "type": "row",
-        "id": "controls",
-        "props": {"gap": 12},
-        "children": [
-          {"type": "button", "id": "inc", "props": {"text": "+1"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "dec", "props": {"text": "-1"}, "on_event": {"click": "ui.append"}},
-          {"type": "button", "id": "compute", "props": {"text": "="}, "on_event": {"click": "ui.compute"}},
-          {"type": "button", "id": "reset", "props": {"text": "Clear"}, "on_event": {"click": "ui.clear"}}
-        ]
-      }
-    ]
-  }
-}"""
-
-    def _build_todo_blueprint(self) -> str:
-        """Generate Todo Blueprint JSON - explicit format for streaming."""
-        return """{
-  "app": {
-    "id": "todo",
-    "name": "Todo App",
-    "version": "1.0.0",
-    "author": "system",
-    "permissions": ["STANDARD"]
-  },
-  "services": [],
-            "ui": {
-                "title": "Todo App",
-                "layout": "vertical",
-                "components": [
-                    {"type": "text", "id": "header", "props": {"content": "Todo List", "variant": "h2"}},
-      {
-        "type": "row",
-        "id": "input",
-        "props": {"gap": 8},
-        "children": [
-          {"type": "input", "id": "task-input", "props": {"placeholder": "New task..."}},
-          {"type": "button", "id": "add", "props": {"text": "Add"}, "on_event": {"click": "ui.list.add"}}
-        ]
-      },
-      {
-        "type": "col",
-        "id": "list",
-        "props": {"gap": 8}
-      }
-    ]
-  }
-}"""
-
     def _build_placeholder_blueprint(self, request: str) -> str:
         """Generate placeholder Blueprint JSON - explicit format for streaming."""
-        import json
-
         return json.dumps(
             {
                 "app": {
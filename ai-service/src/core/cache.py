@@ -4,19 +4,20 @@ Type-safe, testable, and highly extensible cache implementation.
 Supports both in-memory caching with automatic eviction and TTL expiration.
 """
 
-import time
+from time import monotonic_ns
 from typing import Generic, TypeVar, Any
 from collections import OrderedDict
-from dataclasses import dataclass, field
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
 
 from .hash import hash_string, Algorithm
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
-    """Cache statistics."""
+    """Cache statistics (slotted: counters are bumped on every get/set)."""
 
     size: int = 0
     max_size: int = 0
@@ -52,6 +53,8 @@ class LRUCache(Generic[T]):
     - Automatic eviction on size limit
     - Hit/miss statistics
     - Fast O(1) operations
+    - Keys used as-is by default, with optional digests (e.g. xxhash.xxh3_64_intdigest
+      for long keys)
 
     Examples:
         >>> cache = LRUCache[str](max_size=100, ttl_seconds=3600)
@@ -62,11 +65,25 @@ class LRUCache(Generic[T]):
         1.0
     """
 
+    # No per-instance __dict__; subclasses declare their own (possibly empty) slots
+    __slots__ = (
+        "max_size",
+        "ttl_seconds",
+        "hash_algorithm",
+        "hash_fn",
+        "key_fn",
+        "_ttl_ns",
+        "_cache",
+        "_stats",
+    )
+
     def __init__(
         self,
         max_size: int = 100,
         ttl_seconds: int | None = None,
-        hash_algorithm: Algorithm = Algorithm.XXHASH64,
+        hash_algorithm: Algorithm | None = None,
+        hash_fn: Callable[[str], Hashable] | None = None,
+        key_fn: Callable[[str], str] | None = None,
     ):
         """
         Initialize LRU cache.
@@ -74,28 +91,40 @@ class LRUCache(Generic[T]):
         Args:
             max_size: Maximum number of entries
             ttl_seconds: Time-to-live in seconds (None = no expiration)
-            hash_algorithm: Algorithm for computing cache keys
+            hash_algorithm: Optional digest for cache keys (None = key by the string
+                itself; str hashing is done in C and cached on the string object)
+            hash_fn: Optional key function used instead of hash_algorithm
+                (e.g. xxhash.xxh3_64_intdigest to key by int without hex encoding)
+            key_fn: Optional canonicalization applied to every key before lookup,
+                so equivalent keys share one entry (e.g. request normalization)
         """
         if max_size <= 0:
             raise ValueError("max_size must be positive")
 
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
+        # Integer TTL added to monotonic_ns() deadlines: no float math, and
+        # wall-clock (NTP) adjustments can't expire or resurrect entries
+        self._ttl_ns = None if ttl_seconds is None else int(ttl_seconds * 1_000_000_000)
         self.hash_algorithm = hash_algorithm
-
-        self._cache: OrderedDict[str, tuple[T, float]] = OrderedDict()
+        self.hash_fn = hash_fn
+        self.key_fn = key_fn
+
+        # Entries keep the raw key so digest collisions resolve to a miss. OrderedDict
+        # rather than dict: evicting a plain dict's first key via next(iter()) walks
+        # the deleted slots left at its front, which degrades to O(n) on large caches.
+        # Entry: (raw key, value, expiry deadline in monotonic_ns or None)
+        self._cache: OrderedDict[Hashable, tuple[str, T, int | None]] = OrderedDict()
         self._stats = Stats(max_size=max_size)
 
-    def _compute_key(self, key: str) -> str:
+    def _compute_key(self, key: str) -> Hashable:
         """Compute cache key from input string."""
+        if self.hash_fn is not None:
+            return self.hash_fn(key)
+        if self.hash_algorithm is None:
+            return key
         return hash_string(key, self.hash_algorithm, truncate=16)
 
-    def _is_expired(self, timestamp: float) -> bool:
-        """Check if timestamp is expired."""
-        if self.ttl_seconds is None:
-            return False
-        return time.time() - timestamp >= self.ttl_seconds
-
     def get(self, key: str) -> T | None:
         """
         Get cached value if available and not expired.
@@ -106,50 +135,123 @@ class LRUCache(Generic[T]):
         Returns:
             Cached value or None if not found/expired
         """
+        if self.key_fn is not None:
+            key = self.key_fn(key)
         cache_key = self._compute_key(key)
 
-        if cache_key in self._cache:
-            value, timestamp = self._cache[cache_key]
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
 
-            if self._is_expired(timestamp):
-                # Expired - remove it
-                del self._cache[cache_key]
-                self._stats.size = len(self._cache)
-                self._stats.misses += 1
-                return None
+        raw_key, value, expires_at = entry
 
-            # Valid hit - move to end (most recently used)
-            self._cache.move_to_end(cache_key)
-            self._stats.hits += 1
-            return value
+        if raw_key != key:
+            # Digest collision with a different key
+            self._stats.misses += 1
+            return None
+
+        # Deadline fixed at set() time: one compare, no TTL arithmetic per hit
+        if expires_at is not None and monotonic_ns() >= expires_at:
+            # Expired - remove it
+            del self._cache[cache_key]
+            self._stats.size = len(self._cache)
+            self._stats.misses += 1
+            return None
 
-        self._stats.misses += 1
-        return None
+        # Valid hit - move to end (most recently used)
+        self._cache.move_to_end(cache_key)
+        self._stats.hits += 1
+        return value
 
     def set(self, key: str, value: T) -> None:
         """
-        Cache value with current timestamp.
+        Cache value, stamping its expiry deadline.
 
         Args:
             key: Cache key
             value: Value to cache
         """
+        if self.key_fn is not None:
+            key = self.key_fn(key)
         cache_key = self._compute_key(key)
 
-        # Update existing entry
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        # Update existing entry (re-inserted at the end below)
+        self._cache.pop(cache_key, None)
 
         # Add new entry
-        self._cache[cache_key] = (value, time.time())
+        expires_at = None if self._ttl_ns is None else monotonic_ns() + self._ttl_ns
+        self._cache[cache_key] = (key, value, expires_at)
 
-        # Enforce size limit (FIFO eviction)
+        # Enforce size limit (evict least recently used in O(1))
         if len(self._cache) > self.max_size:
             self._cache.popitem(last=False)
             self._stats.evictions += 1
 
         self._stats.size = len(self._cache)
 
+    def get_many(self, keys: Iterable[str]) -> list[T | None]:
+        """
+        Get several cached values in one call.
+
+        Reads the clock once for every TTL check and hoists attribute lookups
+        out of the loop; otherwise behaves like calling get() per key.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached value or None for each key, in order
+        """
+        cache, stats, key_fn = self._cache, self._stats, self.key_fn
+        now = monotonic_ns()
+        results: list[T | None] = []
+
+        for key in keys:
+            if key_fn is not None:
+                key = key_fn(key)
+            cache_key = self._compute_key(key)
+
+            entry = cache.get(cache_key)
+            if entry is None or entry[0] != key:
+                stats.misses += 1
+                results.append(None)
+            elif entry[2] is not None and now >= entry[2]:
+                del cache[cache_key]
+                stats.misses += 1
+                results.append(None)
+            else:
+                cache.move_to_end(cache_key)
+                stats.hits += 1
+                results.append(entry[1])
+
+        stats.size = len(cache)
+        return results
+
+    def set_many(self, items: Iterable[tuple[str, T]]) -> None:
+        """
+        Cache several (key, value) pairs in one call, sharing one expiry deadline.
+
+        Args:
+            items: Key/value pairs, applied in order
+        """
+        cache, stats, key_fn, max_size = self._cache, self._stats, self.key_fn, self.max_size
+        expires_at = None if self._ttl_ns is None else monotonic_ns() + self._ttl_ns
+
+        for key, value in items:
+            if key_fn is not None:
+                key = key_fn(key)
+            cache_key = self._compute_key(key)
+
+            cache.pop(cache_key, None)
+            cache[cache_key] = (key, value, expires_at)
+
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+                stats.evictions += 1
+
+        stats.size = len(cache)
+
     def delete(self, key: str) -> bool:
         """
         Delete entry from cache.
@@ -160,9 +262,12 @@ class LRUCache(Generic[T]):
         Returns:
             True if deleted, False if not found
         """
+        if self.key_fn is not None:
+            key = self.key_fn(key)
         cache_key = self._compute_key(key)
 
-        if cache_key in self._cache:
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry[0] == key:
             del self._cache[cache_key]
             self._stats.size = len(self._cache)
             return True
@@ -184,8 +289,10 @@ class LRUCache(Generic[T]):
 
     def __contains__(self, key: str) -> bool:
         """Check if key exists (doesn't update LRU order)."""
-        cache_key = self._compute_key(key)
-        return cache_key in self._cache
+        if self.key_fn is not None:
+            key = self.key_fn(key)
+        entry = self._cache.get(self._compute_key(key))
+        return entry is not None and entry[0] == key
 
 
 __all__ = ["LRUCache", "Stats"]
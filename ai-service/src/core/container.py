@@ -5,6 +5,7 @@ from injector import Injector, Module, provider, singleton
 from models.loader import ModelLoader, GeminiModel
 from models.config import GeminiConfig
 from agents.ui_generator import UIGenerator
+from agents.ui_cache import UICache
 from agents.tools import ToolRegistry
 from clients.backend import BackendClient
 from handlers.ui import UIHandler
@@ -48,10 +49,20 @@ class CoreModule(Module):
         )
         return ModelLoader.load(config)
 
+    @singleton
+    @provider
+    def provide_ui_cache(self) -> UICache:
+        """Provide process-wide UI spec cache shared by all generators."""
+        return UICache(max_size=256, ttl_seconds=3600)
+
     @singleton
     @provider
     def provide_ui_generator(
-        self, tool_registry: ToolRegistry, model: GeminiModel, backend: BackendClient | None
+        self,
+        tool_registry: ToolRegistry,
+        model: GeminiModel,
+        backend: BackendClient | None,
+        ui_cache: UICache,
     ) -> UIGenerator:
         """Provide UI generator with all dependencies."""
         backend_services = []
@@ -63,6 +74,7 @@ class CoreModule(Module):
             llm=model,
             backend_services=backend_services,
             enable_cache=True,
+            cache=ui_cache,
         )
 
     @singleton
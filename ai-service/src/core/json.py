@@ -10,6 +10,9 @@ from json_repair import repair_json
 
 T = TypeVar("T")
 
+# Decoders are reusable and thread-safe; msgspec decodes str input without a utf-8 copy
+_DECODER = msgspec.json.Decoder()
+
 
 class JSONParseError(Exception):
     """JSON parsing failed."""
@@ -78,8 +81,7 @@ def extract_json(text: str, repair: bool = True) -> dict[str, Any]:
 
     # Try msgspec first (fastest)
     try:
-        decoder = msgspec.json.Decoder()
-        result = decoder.decode(json_str.encode("utf-8"))
+        result = _DECODER.decode(json_str)
         if not isinstance(result, dict):
             raise JSONParseError(f"Expected dict, got {type(result).__name__}")
         return result
@@ -139,7 +141,18 @@ def safe_json_dumps(obj: Any, **kwargs: Any) -> str:
             # Fallback for edge cases
             pass
 
-    # Use stdlib for pretty-printed output or as fallback (most compatible)
+    # orjson pretty-prints with exactly two-space indentation (matches stdlib's layout).
+    # Like the compact path, output differs from stdlib in two ways: non-ASCII text is
+    # raw UTF-8 rather than \uXXXX escapes, and NaN/Infinity encode as null (stdlib
+    # emits bare NaN/Infinity, which isn't valid JSON)
+    if indent == 2:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except (TypeError, ValueError):
+            # Same edge cases as above (e.g. non-str keys, out-of-range integers)
+            pass
+
+    # Use stdlib for other indents or as fallback (most compatible)
     return json.dumps(obj, indent=indent if indent > 0 else None)
 
 
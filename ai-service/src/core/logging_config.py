@@ -40,7 +40,8 @@ def configure_logging(level: str = "INFO", json_logs: bool = False) -> None:
             stream=sys.stdout,
         )
 
-    # Configure structlog
+    # Configure structlog; the filtering wrapper turns calls below log_level
+    # into no-op methods instead of running the processor chain
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
@@ -54,12 +55,13 @@ def configure_logging(level: str = "INFO", json_logs: bool = False) -> None:
             structlog.processors.JSONRenderer() if json_logs else structlog.dev.ConsoleRenderer(),
         ],
         context_class=dict,
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str) -> structlog.BoundLogger:
+def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
     """
     Get a structured logger instance.
 
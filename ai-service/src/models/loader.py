@@ -107,6 +107,15 @@ class GeminiModel:
             logger.error("invoke_error", error=str(e))
             raise
 
+    def warmup(self) -> None:
+        """Open the API connection ahead of the first request (never raises)."""
+        try:
+            # count_tokens is a free round-trip: it sets up the channel without generating
+            self.model.count_tokens("ping")
+            logger.info("model_warmed", model=self.config.model_name)
+        except Exception as e:
+            logger.warning("warmup_failed", error=str(e))
+
     async def ainvoke(self, prompt: str) -> str:
         """Async non-streaming generation (runs sync API in thread pool)."""
         loop = asyncio.get_event_loop()
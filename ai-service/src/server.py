@@ -16,7 +16,7 @@ import ai_pb2_grpc
 from core import configure_logging, get_logger, get_settings, create_container
 from core.tracing import init_tracer, extract_trace_context, set_trace_context
 from handlers import UIHandler, ChatHandler
-from models.loader import ModelLoader
+from models.loader import GeminiModel, ModelLoader
 from monitoring.http_server import start_metrics_server
 
 
@@ -97,6 +97,9 @@ async def serve_async():
     chat_handler = container.get(ChatHandler)
     service = AsyncAIService(ui_handler, chat_handler)
 
+    # Warm the model connection in the background so the first request skips the handshake
+    asyncio.get_running_loop().run_in_executor(None, container.get(GeminiModel).warmup)
+
     # Create async server with keepalive options
     # TODO: Fix tracing_interceptor to be a proper ServerInterceptor class
     server = aio.server(
@@ -185,3 +185,75 @@ def test_type_safety():
     assert isinstance(result, int)
     assert result == 42
 
+
+
+def test_custom_hash_fn():
+    """Test caching with a custom key hash function."""
+    import xxhash
+
+    cache = LRUCache[str](max_size=10, hash_fn=xxhash.xxh3_64_intdigest)
+    long_key = "prompt " * 1000
+
+    cache.set(long_key, "value")
+
+    assert cache.get(long_key) == "value"
+    assert long_key in cache
+    assert cache.get("other") is None
+
+
+def test_hash_collision_is_miss():
+    """Test colliding keys never return each other's values."""
+    cache = LRUCache[str](max_size=10, hash_fn=lambda key: 0)
+
+    cache.set("a", "value_a")
+
+    assert cache.get("b") is None
+    assert "b" not in cache
+    assert cache.delete("b") is False
+    assert cache.get("a") == "value_a"
+
+
+def test_hash_algorithm_keys():
+    """Test digest-keyed caches behave like raw-keyed ones."""
+    from src.core.hash import Algorithm
+
+    for algorithm in (None, Algorithm.XXHASH64, Algorithm.SHA256):
+        cache = LRUCache[str](max_size=10, hash_algorithm=algorithm)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("other") is None
+        assert "key" in cache
+
+
+def test_key_fn_canonicalizes_keys():
+    """Test keys equal under key_fn share one entry."""
+    cache = LRUCache[str](max_size=10, key_fn=str.lower)
+
+    cache.set("Key", "value")
+
+    assert cache.get("KEY") == "value"
+    assert "key" in cache
+    assert cache.delete("kEy") is True
+    assert len(cache) == 0
+
+
+def test_get_set_many():
+    """Test batch operations match per-key behavior."""
+    cache = LRUCache[str](max_size=2)
+
+    cache.set_many([("a", "value_a"), ("b", "value_b"), ("c", "value_c")])  # Evicts "a"
+
+    assert cache.get_many(["a", "b", "c"]) == [None, "value_b", "value_c"]
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+
+def test_stats_slotted():
+    """Test stats counters live in slots, not a per-instance dict."""
+    stats = LRUCache[str](max_size=2).stats
+
+    assert not hasattr(stats, "__dict__")
+    assert isinstance(stats, Stats)
@@ -300,3 +300,21 @@ def test_gemini_model_invoke(gemini_config):
             
             assert result == "response text"
 
+
+
+@pytest.mark.integration
+def test_gemini_model_warmup_never_raises(gemini_config):
+    """Test warmup pings the API and swallows connection errors."""
+    with patch('src.models.loader.genai.configure'):
+        with patch('src.models.loader.genai.GenerativeModel') as mock_model_class:
+            from src.models.loader import GeminiModel
+
+            mock_model_instance = MagicMock()
+            mock_model_class.return_value = mock_model_instance
+
+            model = GeminiModel(gemini_config)
+            model.warmup()
+            mock_model_instance.count_tokens.assert_called_once_with("ping")
+
+            mock_model_instance.count_tokens.side_effect = ConnectionError("offline")
+            model.warmup()  # Logged, not raised
@@ -39,6 +39,12 @@ def test_extract_json_invalid():
         extract_json(text, repair=False)
 
 
+def test_extract_json_unicode_and_repair():
+    """Test non-ASCII text decodes from str and trailing commas are repaired."""
+    assert extract_json('{"title": "Café ✓"}') == {"title": "Café ✓"}
+    assert extract_json('{"items": [1, 2,],}') == {"items": [1, 2]}
+
+
 def test_safe_json_dumps():
     """Test JSON serialization."""
     obj = {"title": "Test", "items": [1, 2, 3]}
@@ -54,6 +60,32 @@ def test_safe_json_dumps_with_indent():
     assert "\n" in result  # Indented output has newlines
 
 
+def test_safe_json_dumps_indent_matches_stdlib_layout():
+    """Test two-space output keeps stdlib's layout and falls back for non-str keys."""
+    obj = {"title": "Test", "items": [1, {"a": None}], "empty": [], "nested": {}}
+
+    assert safe_json_dumps(obj, indent=2) == json.dumps(obj, indent=2)
+    assert json.loads(safe_json_dumps({1: "one"}, indent=2)) == {"1": "one"}
+
+
+def test_safe_json_dumps_indent_keeps_non_ascii_raw():
+    """Test two-space output writes non-ASCII as UTF-8 text and still round-trips."""
+    obj = {"title": "Café ÷ × π", "label": "计算器"}
+
+    result = safe_json_dumps(obj, indent=2)
+
+    assert "Café ÷ × π" in result
+    assert "\\u" not in result
+    assert json.loads(result) == obj
+
+
+def test_safe_json_dumps_indent_non_finite_as_null():
+    """Test NaN and infinities encode as null, keeping the output valid JSON."""
+    result = safe_json_dumps({"nan": float("nan"), "inf": float("inf")}, indent=2)
+
+    assert json.loads(result) == {"nan": None, "inf": None}
+
+
 @given(st.dictionaries(st.text(min_size=1), st.integers()))
 def test_json_roundtrip(data):
     """Property test: JSON serialization roundtrip."""
@@ -0,0 +1,38 @@
+"""Tests for prompt cache module."""
+
+import pytest
+
+from src.agents import prompt_cache
+from src.agents.prompt_cache import PromptCache, get_system_prompt_template
+
+
+@pytest.mark.unit
+def test_prompt_cache_exports():
+    """Test module exports the cache and the populated template getter."""
+    assert prompt_cache.__all__ == ["PromptCache", "get_system_prompt_template"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "prompt_type", ["ui_generation", "chat", "code_generation", "blueprint_generation"]
+)
+def test_system_prompt_template_populated(prompt_type):
+    """Test every known prompt type returns a non-empty template."""
+    assert get_system_prompt_template(prompt_type)
+
+
+@pytest.mark.unit
+def test_system_prompt_template_unknown():
+    """Test unknown prompt types return an empty template."""
+    assert get_system_prompt_template("unknown") == ""
+
+
+@pytest.mark.unit
+def test_prompt_cache_roundtrip():
+    """Test caching and retrieving a prompt."""
+    cache = PromptCache(max_size=2)
+    cache.set("prompt")
+
+    assert cache.get("prompt") == "prompt"
+    assert cache.get("other") is None
+    assert cache.hit_rate == 0.5
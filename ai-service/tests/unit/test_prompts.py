@@ -0,0 +1,71 @@
+"""Tests for prompt builder."""
+
+import pytest
+
+from src.agents.prompts import PromptBuilder
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "tools,context,expected",
+    [
+        ("", "", "SYS\n\n=== REQUEST ===\nREQ"),
+        ("", "CTX", "SYS\n\n=== CONTEXT ===\nCTX\n\n=== REQUEST ===\nREQ"),
+        ("T", "", "SYS\n\n=== AVAILABLE TOOLS ===\nT\n\n=== REQUEST ===\nREQ"),
+        (
+            "T",
+            "CTX",
+            "SYS\n\n=== AVAILABLE TOOLS ===\nT\n\n=== CONTEXT ===\nCTX\n\n=== REQUEST ===\nREQ",
+        ),
+    ],
+)
+def test_build_structured(tools, context, expected):
+    """Test structured prompt layout for every section combination."""
+    assert PromptBuilder.build_structured("SYS", context, tools, "REQ") == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "tools,context,expected",
+    [
+        ("", "", "\n\n=== REQUEST ===\nREQ"),
+        (
+            "T",
+            "CTX",
+            "\n\n=== AVAILABLE TOOLS ===\nT\n\n=== CONTEXT ===\nCTX\n\n=== REQUEST ===\nREQ",
+        ),
+    ],
+)
+def test_build_structured_empty_system(tools, context, expected):
+    """Test an empty system part still leads the prompt with a blank separator."""
+    assert PromptBuilder.build_structured("", context, tools, "REQ") == expected
+
+
+@pytest.mark.unit
+def test_build_structured_keeps_braces():
+    """Test braces in inputs are not treated as format fields."""
+    prompt = PromptBuilder.build_structured("{system}", "", "", '{"json": true}')
+
+    assert prompt == '{system}\n\n=== REQUEST ===\n{"json": true}'
+
+
+@pytest.mark.unit
+def test_build_conversation():
+    """Test conversation prompt assembly."""
+    prompt = PromptBuilder.build_conversation(
+        "SYS", [("user", "hi"), ("assistant", "hello")], "bye"
+    )
+
+    assert prompt == "SYS\n\n\n\nUser: hi\n\nAssistant: hello\n\nUser: bye"
+
+
+@pytest.mark.unit
+def test_ui_generation_prompt_context_last():
+    """Test per-request context is appended after the shared static prefix."""
+    from src.agents.prompt import get_ui_generation_prompt
+
+    base = get_ui_generation_prompt("TOOLS")
+    with_context = get_ui_generation_prompt("TOOLS", "CTX")
+
+    assert with_context == base + "\n\nCTX"
+    assert "TOOLS" in base
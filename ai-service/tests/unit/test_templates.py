@@ -0,0 +1,53 @@
+"""Tests for app template library."""
+
+import pytest
+
+from src.agents.templates import TemplateLibrary
+
+
+@pytest.mark.unit
+def test_template_get():
+    """Test template lookup by ID."""
+    template = TemplateLibrary.get("crud")
+
+    assert template is not None
+    assert template.name == "CRUD Application"
+    assert TemplateLibrary.get("missing") is None
+
+
+@pytest.mark.unit
+def test_template_search_single_term():
+    """Test search matches name, description and service requirements."""
+    assert [t.id for t in TemplateLibrary.search("Dashboard")] == ["dashboard"]
+    assert [t.id for t in TemplateLibrary.search("conversational")] == ["chat"]
+    assert [t.id for t in TemplateLibrary.search("ai")] == ["chat"]
+
+
+@pytest.mark.unit
+def test_template_search_multi_term():
+    """Test every query term must match the same template."""
+    assert [t.id for t in TemplateLibrary.search("chat storage")] == ["chat"]
+    assert TemplateLibrary.search("dashboard conversational") == []
+
+
+@pytest.mark.unit
+def test_template_search_empty_query():
+    """Test empty query returns every template."""
+    assert len(TemplateLibrary.search("")) == len(TemplateLibrary.list_all())
+
+
+@pytest.mark.unit
+def test_template_pattern_loaded_from_data_file():
+    """Test pattern text is read lazily from the template's data file."""
+    template = TemplateLibrary.get("chat")
+
+    assert template.pattern_file == "chat.txt"
+    assert "Message list" in template.pattern
+    assert template.pattern is template.pattern
+
+
+@pytest.mark.unit
+def test_template_search_casefolds_query():
+    """Test query matching ignores case."""
+    assert [t.id for t in TemplateLibrary.search("CHAT INTERFACE")] == ["chat"]
+    assert [t.id for t in TemplateLibrary.search("Data Visualization")] == ["dashboard"]
@@ -0,0 +1,295 @@
+"""Tests for tool registry."""
+
+import sys
+
+import pytest
+
+from src.agents.tools import ToolDefinition, ToolRegistry
+
+# ============================================================================
+# Registration Tests
+# ============================================================================
+
+
+@pytest.mark.unit
+def test_register_bulk():
+    """Test registering many tools in one call."""
+    registry = ToolRegistry()
+    count = len(registry.tools)
+
+    registry.register_bulk(
+        ToolDefinition(id=f"custom.{i}", name=f"Custom {i}", description="Custom tool")
+        for i in range(3)
+    )
+
+    assert len(registry.tools) == count + 3
+    assert registry.get_tool("custom.2").name == "Custom 2"
+
+
+@pytest.mark.unit
+def test_register_bulk_overrides_existing():
+    """Test bulk registration replaces tools with the same ID."""
+    registry = ToolRegistry()
+
+    registry.register_bulk(
+        [ToolDefinition(id="ui.set", name="Override", description="Replaced", category="ui")]
+    )
+
+    assert registry.get_tool("ui.set").name == "Override"
+
+
+# ============================================================================
+# ToolDefinition Tests
+# ============================================================================
+
+
+@pytest.mark.unit
+def test_tool_definition_is_frozen():
+    """Test tool definitions are immutable value objects."""
+    tool = ToolDefinition(id="t", name="T", description="Tool", parameters={"key": "string"})
+
+    with pytest.raises(AttributeError):
+        tool.name = "Other"
+    with pytest.raises(TypeError):
+        tool.parameters["key"] = "number"
+
+
+@pytest.mark.unit
+def test_tool_definition_shares_parameter_schemas():
+    """Test identical parameter schemas are interned to one mapping."""
+    a = ToolDefinition(id="a", name="A", description="A", parameters={"key": "string"})
+    b = ToolDefinition(id="b", name="B", description="B", parameters={"key": "string"})
+    empty = ToolDefinition(id="c", name="C", description="C")
+
+    assert a.parameters is b.parameters
+    assert dict(empty.parameters) == {}
+
+
+@pytest.mark.unit
+def test_tool_definition_unhashable_parameters():
+    """Test nested schema values are accepted without interning."""
+    tool = ToolDefinition(
+        id="t", name="T", description="Tool", parameters={"options": {"type": "string"}}
+    )
+
+    assert tool.parameters["options"] == {"type": "string"}
+
+
+# ============================================================================
+# Description Tests
+# ============================================================================
+
+
+@pytest.mark.unit
+def test_tools_description_cached_until_register():
+    """Test description is reused and rebuilt after registration."""
+    registry = ToolRegistry()
+    first = registry.get_tools_description()
+
+    assert registry.get_tools_description() is first
+
+    registry.register_tool(
+        ToolDefinition(id="ui.custom", name="Custom", description="Custom UI tool", category="ui")
+    )
+    updated = registry.get_tools_description()
+
+    assert updated is not first
+    assert "ui.custom: Custom UI tool (no params)" in updated
+
+
+# ============================================================================
+# Category Index Tests
+# ============================================================================
+
+
+@pytest.mark.unit
+def test_list_tools_by_category():
+    """Test category listing matches a full scan of the registry."""
+    registry = ToolRegistry()
+
+    for category in registry.get_categories():
+        expected = [t for t in registry.tools.values() if t.category == category]
+        assert registry.list_tools(category) == expected
+    assert registry.list_tools("missing") == []
+
+
+@pytest.mark.unit
+def test_category_index_follows_recategorized_tool():
+    """Test re-registering a tool under a new category moves it in the index."""
+    registry = ToolRegistry()
+    registry.register_tool(ToolDefinition(id="x.one", name="One", description="One", category="x"))
+
+    registry.register_tool(ToolDefinition(id="x.one", name="One", description="One", category="y"))
+
+    assert registry.list_tools("x") == []
+    assert "x" not in registry.get_categories()
+    assert [t.id for t in registry.list_tools("y")] == ["x.one"]
+
+
+@pytest.mark.unit
+def test_tool_definition_interns_strings():
+    """Test runtime-built ids, categories and type names are interned."""
+    tool = ToolDefinition(
+        id="".join(["custom", ".", "tool"]),
+        name="Custom",
+        description="Custom tool",
+        parameters={"key": "".join(["str", "ing"])},
+        category="".join(["cus", "tom"]),
+    )
+
+    assert tool.id is sys.intern("custom.tool")
+    assert tool.category is sys.intern("custom")
+    assert tool.parameters["key"] is sys.intern("string")
+
+
+@pytest.mark.unit
+def test_get_tool_sees_later_registrations():
+    """Test lookup reflects tools registered after init and a rebound tools dict."""
+    registry = ToolRegistry()
+
+    registry.register_tool(ToolDefinition(id="late.tool", name="Late", description="Late tool"))
+
+    assert registry.get_tool("late.tool").name == "Late"
+    assert registry.get_tool("missing") is None
+
+    registry.tools = {}
+    assert registry.get_tool("late.tool") is None
+
+
+@pytest.mark.unit
+def test_categories_update_after_register():
+    """Test cached category list picks up new categories."""
+    registry = ToolRegistry()
+    before = registry.get_categories()
+
+    registry.register_bulk(
+        [
+            ToolDefinition(id="z.one", name="One", description="One", category="zeta"),
+            ToolDefinition(id="z.one", name="One", description="One", category="omega"),
+        ]
+    )
+
+    assert registry.get_categories() == sorted(before + ["omega"])
+    assert registry.list_tools("zeta") == []
+
+
+# ============================================================================
+# Built-in Data Tests
+# ============================================================================
+
+
+@pytest.mark.unit
+def test_builtin_tool_groups_loaded_from_json():
+    """Test every built-in group is registered and ids are unique."""
+    from src.agents.tool_categories import TOOL_DEFS, TOOL_GROUPS
+
+    registry = ToolRegistry()
+
+    assert list(TOOL_GROUPS) == ["ui", "app", "system", "math"]
+    assert len({d["id"] for d in TOOL_DEFS}) == len(TOOL_DEFS)
+    assert all(registry.get_tool(d["id"]) is not None for d in TOOL_DEFS)
+
+
+@pytest.mark.unit
+def test_register_group_helper():
+    """Test category helpers register their group without a type argument."""
+    from src.agents.tool_categories import TOOL_GROUPS, register_math_tools
+
+    registry = ToolRegistry()
+    registry.tools.clear()
+    registry._by_category.clear()
+
+    register_math_tools(registry)
+
+    assert [t.id for t in registry.list_tools()] == [d["id"] for d in TOOL_GROUPS["math"]]
+
+
+@pytest.mark.unit
+def test_registries_share_builtins_but_not_state():
+    """Test built-ins are reused across instances without leaking registrations."""
+    first = ToolRegistry()
+    second = ToolRegistry()
+
+    first.register_tool(ToolDefinition(id="only.first", name="First", description="First"))
+
+    assert first.tools is not second.tools
+    assert first.get_tool("ui.set") is second.get_tool("ui.set")
+    assert second.get_tool("only.first") is None
+    assert "only.first" not in second.get_tools_description()
+
+
+@pytest.mark.unit
+def test_tools_description_for_selected_categories():
+    """Test selective description contains only the requested categories, in order."""
+    registry = ToolRegistry()
+
+    description = registry.get_tools_description(["math", "ui", "missing"])
+
+    assert description.startswith("=== FRONTEND TOOLS ===\n\nMATH:")
+    assert "\nUI:" in description
+    assert "\nAPP:" not in description
+    assert description.index("MATH:") < description.index("UI:")
+
+
+@pytest.mark.unit
+def test_tools_description_section_refreshes_after_register():
+    """Test a category block is re-rendered after a tool in it changes."""
+    registry = ToolRegistry()
+    registry.get_tools_description(["app"])
+
+    registry.register_tool(
+        ToolDefinition(id="app.extra", name="Extra", description="Extra app tool", category="app")
+    )
+
+    assert "app.extra: Extra app tool" in registry.get_tools_description(["app"])
+
+
+@pytest.mark.unit
+def test_iter_tools_matches_list_tools():
+    """Test copy-free iteration yields the same tools as list_tools."""
+    registry = ToolRegistry()
+
+    assert list(registry.iter_tools()) == registry.list_tools()
+    assert list(registry.iter_tools("math")) == registry.list_tools("math")
+    assert list(registry.iter_tools("missing")) == []
+
+
+@pytest.mark.unit
+def test_dispatch_raises_for_unknown_tool():
+    """Test dispatch returns registered tools and raises KeyError otherwise."""
+    registry = ToolRegistry()
+    registry.register_tool(ToolDefinition(id="late.tool", name="Late", description="Late tool"))
+
+    assert registry.dispatch("late.tool") is registry.get_tool("late.tool")
+    with pytest.raises(KeyError):
+        registry.dispatch("missing")
+
+    registry.tools = {}
+    with pytest.raises(KeyError):
+        registry.dispatch("late.tool")
+
+
+@pytest.mark.unit
+def test_version_bumps_on_register():
+    """Test the registry version changes with every registration."""
+    registry = ToolRegistry()
+    before = registry.version
+
+    registry.register_tool(ToolDefinition(id="v.one", name="One", description="One"))
+    after_one = registry.version
+    registry.register_bulk([ToolDefinition(id="v.two", name="Two", description="Two")])
+
+    assert len({before, after_one, registry.version}) == 3
+
+
+@pytest.mark.unit
+def test_version_unique_across_registries():
+    """Test registries with the same number of registrations get different versions."""
+    first = ToolRegistry()
+    second = ToolRegistry()
+    assert first.version == second.version
+
+    first.register_tool(ToolDefinition(id="a.tool", name="A", description="A"))
+    second.register_tool(ToolDefinition(id="b.tool", name="B", description="B"))
+
+    assert first.version != second.version
@@ -0,0 +1,68 @@
+"""Tests for UI spec cache."""
+
+import pytest
+
+from src.agents.models import Blueprint
+from src.agents.ui_cache import UICache, _normalize_request
+
+
+@pytest.mark.unit
+def test_normalize_request():
+    """Test case, whitespace and request verbs are canonicalized."""
+    assert _normalize_request("  Create a   Calculator ") == "calculator"
+    assert _normalize_request("build a todo app") == "todo"
+    assert _normalize_request("generate\ta counter") == "counter"
+    assert _normalize_request("rebuild the builder") == "rebuild builder"
+
+
+@pytest.mark.unit
+def test_ui_cache_shares_equivalent_requests():
+    """Test equivalent phrasings hit the same cache entry."""
+    cache = UICache()
+    spec = Blueprint(title="Calculator", components=[])
+
+    cache.set("Create a calculator", spec)
+
+    assert cache.get("build a  CALCULATOR") is spec
+    assert cache.get("make a counter") is None
+
+
+@pytest.mark.unit
+def test_normalize_request_drops_filler_words():
+    """Test near-duplicate phrasings that differ only by filler words share a key."""
+    assert _normalize_request("Please make me a calculator") == "calculator"
+    assert _normalize_request("create calculator") == _normalize_request("make a calculator")
+    assert _normalize_request("a") == ""
+    assert _normalize_request("theme editor") == "theme editor"
+
+
+@pytest.mark.unit
+def test_normalize_request_near_duplicates():
+    """Test verb, app-noun and punctuation variants of one intent share a key."""
+    variants = ["create calculator", "make me a calculator app", "Calculator, please!"]
+
+    assert {_normalize_request(v) for v in variants} == {"calculator"}
+    assert _normalize_request("make-up tracker") == "make-up tracker"
+
+
+@pytest.mark.unit
+def test_normalize_request_keeps_inner_verbs_and_nouns():
+    """Test verbs are only dropped leading and app nouns only trailing."""
+    request = "calculator that can make graphs"
+
+    assert _normalize_request(request) == request
+    assert _normalize_request("build an app store browser") == "app store browser"
+    assert _normalize_request("make an app") == ""
+
+
+@pytest.mark.unit
+def test_scoped_key_normalizes_request_only():
+    """Test scoped keys normalize the request part once and skip all-filler requests."""
+    cache = UICache()
+    spec = Blueprint(title="Calculator", components=[])
+
+    cache.set(cache.scoped_key("tools1", "Make a calculator app"), spec)
+
+    assert cache.get(cache.scoped_key("tools1", "calculator!")) is spec
+    assert cache.get(cache.scoped_key("tools2", "calculator")) is None
+    assert cache.scoped_key("tools1", "make an app") is None
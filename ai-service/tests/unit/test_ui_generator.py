@@ -0,0 +1,223 @@
+"""Tests for UI generator."""
+
+import pytest
+
+from src.agents.tools import ToolDefinition, ToolRegistry
+from src.agents.ui_cache import UICache
+from src.agents.ui_generator import UIGenerator
+
+
+@pytest.mark.unit
+def test_rule_based_blueprint_parsed_once(monkeypatch):
+    """Test fixed blueprints are parsed at import; only placeholders are parsed per request."""
+    from src.agents import ui_generator
+
+    parsed = []
+    parse = ui_generator.parse_blueprint
+    monkeypatch.setattr(ui_generator, "parse_blueprint", lambda s: parsed.append(s) or parse(s))
+    generator = UIGenerator(ToolRegistry(), enable_cache=False)
+
+    for i in range(40):
+        generator.generate_ui(f"weather station {i}")
+    first = generator.generate_ui("calculator")
+    second = generator.generate_ui("calculator")
+
+    assert len(parsed) == 40
+    assert first is not second
+    assert first.model_dump() == second.model_dump()
+    assert first.title == "Calculator"
+
+
+@pytest.mark.unit
+def test_cache_hit_reuses_rendered_json():
+    """Test repeat cache hits stream the same JSON without re-dumping the model."""
+    generator = UIGenerator(ToolRegistry(), enable_cache=True)
+    generator.generate_ui("calculator")  # Populates the cache
+
+    first = [item for item in generator.generate_ui_stream("calculator") if isinstance(item, str)]
+    cached = generator.cache.get(generator._cache_key("calculator"))
+    chunks = cached._stream_chunks
+    second = [item for item in generator.generate_ui_stream("calculator") if isinstance(item, str)]
+
+    assert chunks is not None
+    assert cached._stream_chunks is chunks
+    assert first == second == list(chunks)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+@pytest.mark.unit
+def test_generators_share_injected_cache():
+    """Test generators given the same cache see each other's entries."""
+    cache = UICache()
+    first = UIGenerator(ToolRegistry(), cache=cache)
+    second = UIGenerator(ToolRegistry(), cache=cache)
+
+    blueprint = first.generate_ui("counter")
+
+    assert second.cache is cache
+    assert cache.get(second._cache_key("counter")) is blueprint
+    assert UIGenerator(ToolRegistry(), enable_cache=False, cache=cache).cache is None
+
+
+@pytest.mark.unit
+def test_shared_cache_scoped_per_registry():
+    """Test registries with different custom tools don't serve each other's cached specs."""
+    cache = UICache()
+    first_registry = ToolRegistry()
+    second_registry = ToolRegistry()
+    first_registry.register_tool(ToolDefinition(id="a.tool", name="A", description="A"))
+    second_registry.register_tool(ToolDefinition(id="b.tool", name="B", description="B"))
+    first = UIGenerator(first_registry, cache=cache)
+    second = UIGenerator(second_registry, cache=cache)
+
+    blueprint = first.generate_ui("calculator")
+
+    assert first._cache_key("calculator") != second._cache_key("calculator")
+    assert second.generate_ui("calculator") is not blueprint
+    assert first.generate_ui("calculator") is blueprint
+
+
+@pytest.mark.unit
+def test_prompt_prefix_reused_until_tools_change():
+    """Test the system prompt prefix is rendered once and rebuilt after a register."""
+    registry = ToolRegistry()
+    generator = UIGenerator(registry, enable_cache=False)
+    prefix = generator._get_prompt_prefix()
+
+    assert generator._get_prompt_prefix() is prefix
+
+    registry.register_tool(
+        ToolDefinition(id="ui.extra", name="Extra", description="Extra UI tool", category="ui")
+    )
+    updated = generator._get_prompt_prefix()
+
+    assert updated is not prefix
+    assert "ui.extra: Extra UI tool" in updated
+
+
+@pytest.mark.unit
+def test_invalidate_tool_cache_picks_up_backend_services():
+    """Test replaced backend services show up after invalidating the prefix."""
+    from types import SimpleNamespace
+
+    generator = UIGenerator(ToolRegistry(), enable_cache=False)
+    prefix = generator._get_prompt_prefix()
+    param = SimpleNamespace(name="key", type="string")
+    tool = SimpleNamespace(id="kv.get", parameters=[param], description="Read a value")
+    generator.backend_services = [SimpleNamespace(name="kv", tools=[tool])]
+
+    assert generator._get_prompt_prefix() is prefix
+
+    generator.invalidate_tool_cache()
+
+    assert "kv.get(key:string): Read a value" in generator._get_prompt_prefix()
+
+
+@pytest.mark.unit
+def test_rule_based_stream_chunks_reused():
+    """Test fixed blueprints stream the same 50-char chunks however many placeholders run."""
+    generator = UIGenerator(ToolRegistry(), enable_cache=False)
+
+    first = [item for item in generator.generate_ui_stream("counter") if isinstance(item, str)]
+    for i in range(40):
+        list(generator.generate_ui_stream(f"weather station {i}"))
+    second = [item for item in generator.generate_ui_stream("counter") if isinstance(item, str)]
+
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert all(len(chunk) <= 50 for chunk in first)
+    assert generator.generate_ui("counter").title == "Counter"
+
+
+class _FakeLLM:
+    """LLM stub streaming fixed tokens."""
+
+    def __init__(self, tokens: list[str]) -> None:
+        self.tokens = tokens
+
+    def stream(self, prompt: str):
+        return iter(self.tokens)
+
+
+@pytest.mark.unit
+def test_llm_stream_chunks_from_first_brace():
+    """Test LLM output is re-chunked from the first brace and parsed at the end."""
+    from src.agents.ui_generator import _COUNTER_BLUEPRINT
+
+    text = "Here you go:\n```json\n" + _COUNTER_BLUEPRINT + "\n```"
+    tokens = [text[i : i + 7] for i in range(0, len(text), 7)]
+    generator = UIGenerator(ToolRegistry(), llm=_FakeLLM(tokens), enable_cache=False)
+
+    items = list(generator.generate_ui_stream("counter"))
+    chunks = [item for item in items if isinstance(item, str)]
+
+    assert "".join(chunks) == text[text.index("{") :]
+    assert all(len(chunk) == 50 for chunk in chunks[:-1])
+    assert items[-1].title == "Counter"
+
+
+@pytest.mark.unit
+def test_cached_blueprint_is_frozen():
+    """Test shared cached specs can't be reassigned by a consumer."""
+    from pydantic import ValidationError
+
+    blueprint = UIGenerator(ToolRegistry(), enable_cache=False).generate_ui("todo")
+
+    with pytest.raises(ValidationError):
+        blueprint.title = "Other"
+    with pytest.raises(ValidationError):
+        blueprint.components[0].type = "text"
+
+
+@pytest.mark.unit
+def test_generate_ui_cache_hit_skips_streaming():
+    """Test non-streaming hits return the cached spec without rendering chunks."""
+    generator = UIGenerator(ToolRegistry(), cache=UICache())
+
+    first = generator.generate_ui("counter")
+    second = generator.generate_ui("counter")
+
+    assert second is first
+    assert first._stream_chunks is None
+    assert generator.cache.stats.hits == 1
+    assert generator.cache.stats.misses == 1
+
+
+@pytest.mark.unit
+def test_cache_scoped_to_tool_set():
+    """Test specs cached before a tool registration are regenerated afterwards."""
+    registry = ToolRegistry()
+    generator = UIGenerator(registry, cache=UICache())
+    first = generator.generate_ui("make a counter")
+
+    assert generator.generate_ui("create counter") is first
+
+    registry.register_tool(ToolDefinition(id="ui.extra", name="Extra", description="Extra"))
+
+    assert generator.generate_ui("make a counter") is not first
+
+
+@pytest.mark.unit
+def test_all_filler_requests_not_cached():
+    """Test requests that normalize to nothing don't share one cache entry."""
+    generator = UIGenerator(ToolRegistry(), cache=UICache())
+
+    generator.generate_ui("make an app")
+    generator.generate_ui("create an application, please")
+    assert len(generator.cache) == 0
+
+    generator.generate_ui("make a calculator app")
+    assert generator.cache.get(generator._cache_key("Calculator!")) is not None
+
+
+@pytest.mark.unit
+def test_repeated_app_nouns_not_collapsed_to_scope():
+    """Test scoped keys are normalized once, so app-noun requests keep distinct entries."""
+    generator = UIGenerator(ToolRegistry(), cache=UICache())
+
+    first = generator.generate_ui("app app")
+    second = generator.generate_ui("application app")
+    generator.generate_ui("make app app")  # Same intent as "app app"
+
+    assert second is not first
+    assert generator.generate_ui("app app") is first
+    assert len(generator.cache) == 2